@@ -1,15 +1,27 @@
 import customtkinter
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, ImageDraw, ImageFont
 import os
 import sys
 import json
-import subprocess
-import webbrowser
-import hashlib
+import io
+import mmap
 import uuid
-from filelock import FileLock  # 导入文件锁库，解决并发写入问题
-from typing import Optional, List
+import threading
+import time
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Optional, List, Dict, Tuple, Callable, TYPE_CHECKING
+try:
+    import orjson  # 可选依赖：更快的JSON解析/序列化，未安装时使用标准库json
+except ImportError:
+    orjson = None
+# 以下模块只在特定操作中用到，延迟到使用时再导入以加快启动：
+# hashlib（计算校验值）、filelock（写入配置）、subprocess/webbrowser（启动游戏）
+if TYPE_CHECKING:
+    import subprocess
+    from filelock import FileLock
 
 # 全局配置：解决中文路径和权限问题
 APP_NAME = "Any Launcher"
@@ -18,18 +30,53 @@ USER_CONFIG_DIR = os.path.join(os.getenv("APPDATA", os.path.dirname(__file__)),
 os.makedirs(USER_CONFIG_DIR, exist_ok=True)  # 确保目录存在
 LOCK_FILE_PATH = os.path.join(USER_CONFIG_DIR, "games.lock")  # 文件锁路径
 GAMES_JSON_DEFAULT = os.path.join(USER_CONFIG_DIR, "games.json")
+# 计算文件校验值时每次读取的字节数（大块读取减少系统调用次数）
+HASH_CHUNK_SIZE = 1024 * 1024
+# 超过该大小的文件不做内存映射（32位进程地址空间有限，改用分块读取）
+MMAP_MAX_SIZE = sys.maxsize if sys.maxsize > 2 ** 32 else 2 ** 31 - 1
+# 文件校验算法：仅用于本地完整性校验，BLAKE2b比MD5更快且为标准库自带
+HASH_ALGORITHM = "blake2b"
+LEGACY_HASH_ALGORITHM = "md5"  # 旧版配置中"md5"字段使用的算法
+HASH_CACHE_FILE = os.path.join(USER_CONFIG_DIR, "hash_cache.json")  # 校验值缓存文件，重启后仍可复用
+HASH_CACHE_MAX_ENTRIES = 256
 
 customtkinter.set_appearance_mode("dark")
-ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.ico")
+FONT_FAMILY = "Microsoft YaHei UI"
+# 程序所在目录及资源路径（启动时计算一次，绝对路径可正确处理中文路径）
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ICON_PATH = os.path.join(SCRIPT_DIR, "app.ico")
+LOGO_PATH = os.path.join(SCRIPT_DIR, "logo.png")
+# Logo缩放滤镜：Pillow 9.1起移到Image.Resampling，启动时解析一次，兼容新旧版本
+LOGO_RESAMPLE = getattr(Image, "Resampling", Image).BICUBIC
 # 存储游戏子进程，用于主窗口关闭时清理
-GAME_PROCESSES: List[subprocess.Popen] = []
-
-
+GAME_PROCESSES: List["subprocess.Popen"] = []
+# 非Windows系统：游戏所在的进程组ID（等于游戏进程ID）。游戏进程退出后组内可能仍有它启动的子进程，
+# 因此单独跟踪，直到整个进程组都已退出
+GAME_PROCESS_GROUPS: List[int] = []
+# 校验值缓存：(算法, 绝对路径, 修改时间ns, 文件大小) -> 校验值，文件未变化时无需重新计算
+_HASH_CACHE: Dict[Tuple[str, str, int, int], str] = {}
+_HASH_CACHE_LOCK = threading.Lock()
+# 后台计算校验值的线程池（hashlib计算时释放GIL，界面线程不会被阻塞）
+_HASH_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="hash")
+# 已提交但尚未完成的校验值任务（退出时取消，兼容没有cancel_futures的Python 3.8）
+_HASH_JOBS = set()
+# 旧版md5记录是否正在后台迁移（避免重复提交同一批计算）
+_legacy_migration_running = False
+# 已解析的游戏配置及预建索引（见load_games_index），避免每次操作都重新解析JSON、遍历列表
+_games_cache: Optional[dict] = None
+# 界面字体缓存：字号 -> CTkFont，供customtkinter控件共用（仅统一字体定义，各控件仍会按缩放比例生成自己的字体）
+_FONTS: Dict[int, customtkinter.CTkFont] = {}
+# 游戏配置文件锁：全局复用同一对象（首次使用时创建），同一线程内可重入
+_games_lock: Optional["FileLock"] = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_games_data_file() -> str:
     """
     获取游戏数据文件路径（修复权限问题）
     优先：用户AppData目录（确保可写）
     兼容：打包后exe目录（仅当可写时使用）
+    结果在进程内缓存，避免每次调用都检查目录权限
     """
     # 先尝试exe目录（兼容旧版本用户数据）
     if getattr(sys, 'frozen', False):
@@ -42,44 +89,525 @@ def get_games_data_file() -> str:
     return GAMES_JSON_DEFAULT
 
 
-def get_file_md5(file_path: str) -> Optional[str]:
-    """计算文件MD5值（用于游戏文件完整性校验）"""
-    if not os.path.exists(file_path):
+@functools.lru_cache(maxsize=None)
+def get_logo_font(size: int):
+    """获取绘制Logo提示文字用的黑体字体（首次使用时解析字体文件，不存在则返回None）"""
+    if not os.path.exists("simhei.ttf"):
+        return None
+    return ImageFont.truetype("simhei.ttf", size)
+
+
+@functools.lru_cache(maxsize=1)
+def get_logo_bytes() -> Optional[bytes]:
+    """读取logo.png的原始内容（每个进程只读取一次，重新加载Logo时直接复用；文件不存在返回None）"""
+    if not os.path.exists(LOGO_PATH):
+        return None
+    with open(LOGO_PATH, 'rb') as f:
+        return f.read()
+
+
+def get_font(size: int) -> customtkinter.CTkFont:
+    """获取指定字号的customtkinter控件字体（首次使用时创建，需在主窗口创建之后调用；普通Tk控件请直接使用字体元组）"""
+    font = _FONTS.get(size)
+    if font is None:
+        font = _FONTS[size] = customtkinter.CTkFont(family=FONT_FAMILY, size=size)
+    return font
+
+
+@contextmanager
+def _games_locked():
+    """持有游戏配置文件锁（解决并发写入问题），最多等待5秒"""
+    global _games_lock
+    if _games_lock is None:
+        from filelock import FileLock
+        _games_lock = FileLock(LOCK_FILE_PATH)
+    with _games_lock.acquire(timeout=5):
+        yield
+
+
+def loads_json(data: bytes):
+    """解析UTF-8编码的JSON（优先使用orjson）"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps_json(obj) -> bytes:
+    """序列化为UTF-8编码、缩进2格的JSON（优先使用orjson）"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def load_games_index(games_data_file: str) -> dict:
+    """
+    读取游戏配置及索引（文件路径、修改时间、大小均未变化时直接返回上次解析的结果）
+    读取不修改文件，先不加锁；解析失败可能是正遇到其他进程写入，此时加锁重新读取一次（解析仍在锁外）
+    返回{"games": 游戏列表, "last_selected": 上次选中的游戏或None, "by_name": 名称 -> 第一个同名游戏}
+    结果与缓存共享，调用方不得直接修改；读取/解析错误由调用方处理
+    """
+    try:
+        return _load_games_index(games_data_file)
+    except json.JSONDecodeError:
+        return _load_games_index(games_data_file, locked=True)
+
+
+def _load_games_index(games_data_file: str, locked: bool = False) -> dict:
+    """:param locked: 是否在读取文件时加锁（只锁住读取，解析在锁外进行）"""
+    global _games_cache
+    with _games_locked() if locked else nullcontext():
+        stat = os.stat(games_data_file)
+        # 路径、修改时间、大小均一致才视为同一份文件（修改时间精度不足时大小可辅助判断）
+        key = (games_data_file, stat.st_mtime_ns, stat.st_size)
+        if _games_cache is not None and _games_cache["key"] == key:
+            return _games_cache
+        with open(games_data_file, 'rb') as f:
+            data = f.read()
+    games = loads_json(data)
+    # 解析时一次性建立索引，之后的查找无需再遍历列表
+    last_selected = None
+    by_name: Dict[str, dict] = {}
+    for game in games:
+        if last_selected is None and game.get("is_last_selected", False):
+            last_selected = game
+        by_name.setdefault(game.get("name"), game)  # 同名游戏只记录第一个
+    _games_cache = {"key": key, "games": games, "last_selected": last_selected, "by_name": by_name}
+    return _games_cache
+
+
+def load_games_cached(games_data_file: str) -> List[dict]:
+    """读取游戏配置列表（缓存规则同load_games_index）"""
+    return load_games_index(games_data_file)["games"]
+
+
+def invalidate_games_cache():
+    """写入游戏配置后调用，丢弃已解析的缓存"""
+    global _games_cache
+    _games_cache = None
+
+
+def update_games_file(
+    games_data_file: str,
+    mutator: Callable[[List[dict]], bool],
+    reset_if_corrupted: bool = False
+) -> Optional[List[dict]]:
+    """
+    加锁读改写游戏配置：读取（优先使用缓存）后由mutator修改，再原子写回
+    mutator原地修改游戏列表（每条记录均为副本），返回False表示放弃保存
+    :param reset_if_corrupted: 配置文件损坏时以空列表重新开始，否则抛出JSONDecodeError
+    :return: 保存后的游戏列表，放弃保存时返回None；读写错误以异常抛出，由调用方提示
+    """
+    with _games_locked():
+        games = []
+        try:
+            games = [dict(game) for game in _load_games_index(games_data_file)["games"]]
+        except FileNotFoundError:
+            pass  # 配置文件不存在：以空列表开始，确需保存时再创建
+        except json.JSONDecodeError:
+            if not reset_if_corrupted:
+                raise
+        if not mutator(games):
+            return None
+        write_file_atomic(games_data_file, dumps_json(games))
+        invalidate_games_cache()
+    return games
+
+
+def write_file_atomic(file_path: str, data: bytes):
+    """
+    原子写入：先写入同目录下的临时文件并落盘，再用os.replace替换目标文件
+    不加锁的读取方只会看到旧文件或完整的新文件，不会读到写了一半的内容
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # Windows下目标文件正被其他进程读取时替换会失败，稍等后重试
+        for attempt in range(5):
+            try:
+                os.replace(tmp_path, file_path)
+                break
+            except PermissionError:
+                if attempt == 4:
+                    raise
+                time.sleep(0.05)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def get_file_hash(file_path: str, algorithm: str = HASH_ALGORITHM) -> Optional[str]:
+    """计算文件校验值（用于游戏文件完整性校验，文件未变化时直接返回缓存）"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
         return None
+    cache_key = (algorithm, os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _HASH_CACHE_LOCK:
+        cached_hash = _HASH_CACHE.pop(cache_key, None)
+        if cached_hash:
+            _HASH_CACHE[cache_key] = cached_hash  # 移到末尾，按最近使用淘汰
+            return cached_hash
+
+    import hashlib
     try:
-        with open(file_path, "rb") as f:
-            md5_obj = hashlib.md5()
-            while chunk := f.read(4096):
-                md5_obj.update(chunk)
-        return md5_obj.hexdigest()
+        with open(file_path, "rb", buffering=0) as f:  # 无缓冲读取，避免二次拷贝
+            hash_obj = None
+            if 0 < stat.st_size <= MMAP_MAX_SIZE:
+                try:
+                    # 映射整个文件，一次update即在C层完成计算，无需Python层循环
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hash_obj = hashlib.new(algorithm)
+                        hash_obj.update(mm)
+                except (OSError, ValueError, OverflowError):
+                    hash_obj = None  # 无法映射（如地址空间不足）时退回分块读取
+            if hash_obj is None:
+                hash_obj = hashlib.new(algorithm)
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    hash_obj.update(chunk)
+        file_hash = hash_obj.hexdigest()
     except Exception:
         return None
 
+    # 同一文件同一算法只保留最新的记录，超出上限时淘汰最久未使用的
+    with _HASH_CACHE_LOCK:
+        for key in [k for k in _HASH_CACHE if k[:2] == cache_key[:2]]:
+            del _HASH_CACHE[key]
+        _HASH_CACHE[cache_key] = file_hash
+        while len(_HASH_CACHE) > HASH_CACHE_MAX_ENTRIES:
+            del _HASH_CACHE[next(iter(_HASH_CACHE))]
+    return file_hash
+
+
+def get_file_hash_async(file_path: str, algorithm: str = HASH_ALGORITHM) -> Future:
+    """在后台线程计算文件校验值，返回Future"""
+    return _submit_hash_job(get_file_hash, file_path, algorithm)
+
+
+def get_file_hash_with_stat(
+    file_path: str,
+    algorithm: str = HASH_ALGORITHM
+) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+    """
+    计算文件校验值，并返回计算时文件的(大小, 修改时间ns)，写入记录时二者对应同一份文件内容
+    计算失败或计算期间文件发生变化时，文件状态返回None
+    """
+    file_stat = get_file_stat(file_path)
+    file_hash = get_file_hash(file_path, algorithm)
+    if file_hash is None or file_stat is None or get_file_stat(file_path) != file_stat:
+        return file_hash, None
+    return file_hash, file_stat
+
+
+def get_file_hash_with_stat_async(file_path: str) -> Future:
+    """在后台线程计算文件校验值及对应的文件状态（见get_file_hash_with_stat），返回Future"""
+    return _submit_hash_job(get_file_hash_with_stat, file_path)
+
+
+def _submit_hash_job(fn: Callable, *args) -> Future:
+    """向校验值线程池提交任务，并记录未完成的任务以便退出时取消"""
+    future = _HASH_POOL.submit(fn, *args)
+    with _HASH_CACHE_LOCK:
+        _HASH_JOBS.add(future)
+    future.add_done_callback(_discard_hash_job)
+    return future
+
+
+def _discard_hash_job(future: Future):
+    with _HASH_CACHE_LOCK:
+        _HASH_JOBS.discard(future)
+
+
+def shutdown_hash_pool():
+    """
+    退出时关闭校验值线程池并取消排队中的任务，避免进程在窗口关闭后继续计算大文件
+    （正在计算的任务仍会完成后才退出）
+    """
+    if sys.version_info >= (3, 9):
+        _HASH_POOL.shutdown(wait=False, cancel_futures=True)
+        return
+    # Python 3.8没有cancel_futures参数，逐个取消尚未开始的任务
+    with _HASH_CACHE_LOCK:
+        pending = list(_HASH_JOBS)
+    for future in pending:
+        future.cancel()
+    _HASH_POOL.shutdown(wait=False)
+
+
+def gather_futures(futures: List[Future]) -> Future:
+    """合并多个Future：全部完成后以结果列表（顺序同参数，出错的为None）完成，可配合run_when_done一次等待"""
+    combined: Future = Future()
+    results = [None] * len(futures)
+    remaining = [len(futures)]
+    lock = threading.Lock()
+    if not futures:
+        combined.set_result(results)
+        return combined
+
+    def on_done(index: int, future: Future):
+        results[index] = None if future.exception() else future.result()
+        with lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished:
+            combined.set_result(results)
+
+    for index, future in enumerate(futures):
+        future.add_done_callback(lambda future, index=index: on_done(index, future))
+    return combined
+
+
+def get_file_stat(file_path: str) -> Optional[Tuple[int, int]]:
+    """获取文件的(大小, 修改时间ns)，用于无需读取内容即可判断文件是否变化"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_game_file_stat(game: dict) -> Optional[Tuple[int, int]]:
+    """获取游戏记录中保存的(大小, 修改时间ns)，旧记录没有则返回None"""
+    if game.get("size") is None or game.get("mtime_ns") is None:
+        return None
+    return game["size"], game["mtime_ns"]
+
+
+def record_file_stat(game: dict, file_stat: Optional[Tuple[int, int]]):
+    """将计算校验值时的文件大小和修改时间写入游戏记录（为None时清除，启动时总是重新校验）"""
+    game["size"], game["mtime_ns"] = file_stat if file_stat else (None, None)
+
+
+def get_game_id(game: dict) -> str:
+    """
+    获取游戏ID；旧记录没有ID时由路径生成固定ID（同一记录每次得到相同结果，可据此匹配）
+    """
+    game_id = game.get("id")
+    if game_id:
+        return game_id
+    import hashlib
+    return hashlib.blake2b(game.get("path", "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+def get_game_hash(game: dict) -> Tuple[Optional[str], str]:
+    """获取游戏记录的校验值及其算法（兼容旧版仅含md5字段的记录）"""
+    if "hash" in game or "md5" not in game:
+        return game.get("hash"), HASH_ALGORITHM
+    return game["md5"], LEGACY_HASH_ALGORITHM
+
+
+def migrate_legacy_hashes(widget, games_data_file: str, games: List[dict], on_done: Callable[[], None]):
+    """
+    将旧版记录的md5字段迁移为hash字段并写回配置
+    两种校验值都在线程池中计算（不阻塞界面，也不占用配置文件锁），全部完成后再加锁一次写入
+    仅在文件MD5与记录一致、且计算期间文件未变化时才采用新校验值，避免把已被篡改的文件当作可信；
+    其余记录保留旧字段，启动时仍按MD5校验，下次加载时再尝试
+    :param widget: 用于在界面线程中等待结果的窗口
+    :param on_done: 写回成功后在界面线程中调用
+    """
+    global _legacy_migration_running
+    if _legacy_migration_running:
+        return
+    # (记录ID, 旧md5, 路径, 计算前的文件状态)，以及每条记录的(MD5, 新校验值)计算任务
+    jobs: List[Tuple[str, str, str, Optional[Tuple[int, int]]]] = []
+    futures: List[Future] = []
+    for game in games:
+        if "md5" not in game or "hash" in game:
+            continue
+        legacy_md5 = game["md5"]
+        game_path = game.get("path", "")
+        file_stat = get_file_stat(game_path) if legacy_md5 else None
+        if legacy_md5 and file_stat is None:
+            continue  # 文件缺失：保留旧字段
+        jobs.append((get_game_id(game), legacy_md5, game_path, file_stat))
+        if legacy_md5:
+            futures.append(get_file_hash_async(game_path, LEGACY_HASH_ALGORITHM))
+            futures.append(get_file_hash_async(game_path))
+    if not jobs:
+        return
+
+    def on_hashes(hashes: List[Optional[str]]):
+        global _legacy_migration_running
+        _legacy_migration_running = False
+        # 记录ID -> (旧md5, 新校验值, 文件状态)
+        updates: Dict[str, Tuple[str, Optional[str], Optional[Tuple[int, int]]]] = {}
+        results = iter(hashes)
+        for game_id, legacy_md5, game_path, file_stat in jobs:
+            if not legacy_md5:
+                updates[game_id] = (legacy_md5, None, None)
+                continue
+            md5_hash, new_hash = next(results), next(results)
+            if md5_hash == legacy_md5 and new_hash and get_file_stat(game_path) == file_stat:
+                updates[game_id] = (legacy_md5, new_hash, file_stat)
+        if not updates:
+            return
+
+        def apply_hashes(games: List[dict]) -> bool:
+            changed = False
+            for game in games:
+                update = updates.get(get_game_id(game))
+                # 计算期间记录可能已被修改，只迁移仍是原样的旧记录
+                if update is None or "hash" in game or game.get("md5") != update[0]:
+                    continue
+                _, game["hash"], file_stat = update
+                if file_stat:
+                    record_file_stat(game, file_stat)
+                del game["md5"]
+                changed = True
+            return changed
+
+        try:
+            saved = update_games_file(games_data_file, apply_hashes)
+        except Exception:
+            return  # 写入失败则下次再试
+        if saved is not None:
+            on_done()
+
+    _legacy_migration_running = True
+    run_when_done(widget, gather_futures(futures), on_hashes)
+
+
+def run_when_done(widget, future: Future, callback):
+    """
+    在界面线程中轮询后台任务，完成后以结果调用callback
+    （Tk不允许在工作线程中操作界面；窗口已关闭时直接丢弃结果）
+    """
+    def poll():
+        if not widget.winfo_exists():
+            return
+        if future.done():
+            callback(future.result())
+        else:
+            (widget.master or widget).after(50, poll)
+    poll()
+
+
+def load_hash_cache():
+    """启动时读取持久化的校验值缓存（缓存损坏时忽略）"""
+    try:
+        with open(HASH_CACHE_FILE, 'rb') as f:
+            entries = loads_json(f.read())
+        for algorithm, path, mtime_ns, size, file_hash in entries[-HASH_CACHE_MAX_ENTRIES:]:
+            _HASH_CACHE[(algorithm, path, int(mtime_ns), int(size))] = file_hash
+    except Exception:
+        _HASH_CACHE.clear()
+
+
+def save_hash_cache():
+    """退出时保存校验值缓存（写入失败不影响退出）"""
+    try:
+        with _HASH_CACHE_LOCK:
+            entries = [[*key, file_hash] for key, file_hash in _HASH_CACHE.items()]
+        write_file_atomic(HASH_CACHE_FILE, dumps_json(entries))
+    except Exception:
+        pass
+
 
 def import_game():
-    game_path = tk.filedialog.askopenfilename(
+    selected_paths = tk.filedialog.askopenfilenames(
         title="选择游戏可执行文件",
         filetypes=[("可执行文件", "*.exe"), ("HTML文件", "*.html"), ("所有文件", "*.*")]
     )
-    if not game_path:
+    if not selected_paths:
         return
     # 处理中文路径：确保路径编码正确
-    game_path = os.path.abspath(game_path)
-    if not os.path.exists(game_path):
-        tk.messagebox.showerror("错误", f"文件不存在：{game_path}")
+    game_paths = []
+    for game_path in selected_paths:
+        game_path = os.path.abspath(game_path)
+        if not os.path.exists(game_path):
+            tk.messagebox.showerror("错误", f"文件不存在：{game_path}")
+            continue
+        game_paths.append(game_path)
+    if not game_paths:
+        return
+
+    if len(game_paths) == 1:
+        # 提取默认名称（去除扩展名）
+        default_name = os.path.splitext(os.path.basename(game_paths[0]))[0]
+        # 打开编辑窗口（校验值在窗口中后台计算）
+        EditGameWindow(default_name, game_paths[0], get_games_data_file())
+    elif getattr(Select, "instance", None):
+        import_games(game_paths, Select.instance)
+
+
+def import_games(game_paths: List[str], select_window: "Select"):
+    """
+    批量导入多个游戏（使用默认名称）：校验值在线程池中并行计算，
+    全部完成后一次加锁写入配置；在主窗口中等待结果，中途关闭选择窗口不影响导入
+    """
+    select_window.import_button.configure(state="disabled")
+
+    def on_hashes(results: List[Optional[Tuple[Optional[str], Optional[Tuple[int, int]]]]]):
+        if select_window.winfo_exists():
+            select_window.import_button.configure(state="normal")
+        imported, failed = [], []
+        for game_path, result in zip(game_paths, results):
+            # 校验值及计算时的文件状态均有效才导入（计算期间文件被修改也视为失败）
+            if result and result[0] and result[1]:
+                imported.append((game_path, *result))
+            else:
+                failed.append(game_path)
+        # 先立即写入，文件状态与校验值对应计算时的文件内容
+        if imported:
+            save_imported_games(imported)
+        if failed:
+            tk.messagebox.showerror(
+                "错误",
+                "以下文件校验值计算失败（或计算期间文件被修改），未导入：\n" + "\n".join(failed)
+            )
+
+    futures = [get_file_hash_with_stat_async(game_path) for game_path in game_paths]
+    run_when_done(select_window.parent, gather_futures(futures), on_hashes)
+
+
+def save_imported_games(imported: List[Tuple[str, str, Tuple[int, int]]]):
+    """将批量导入的(路径, 校验值, 计算时的文件状态)一次性写入配置文件"""
+    def add_games(games: List[dict]) -> bool:
+        for game_path, game_hash, file_stat in imported:
+            new_game = {
+                "id": str(uuid.uuid4()),
+                "name": os.path.splitext(os.path.basename(game_path))[0],
+                "path": game_path,
+                "hash": game_hash,
+                "is_last_selected": False
+            }
+            record_file_stat(new_game, file_stat)
+            games.append(new_game)
+        return True
+
+    games_data_file = get_games_data_file()
+    try:
+        try:
+            update_games_file(games_data_file, add_games)
+        except json.JSONDecodeError:
+            if not tk.messagebox.askyesno("警告", "配置文件损坏，是否清空重新创建？"):
+                return
+            update_games_file(games_data_file, add_games, reset_if_corrupted=True)
+    except PermissionError:
+        tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行启动器！")
+        return
+    except Exception as e:
+        tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
         return
 
-    # 提取默认名称（去除扩展名）
-    default_name = os.path.splitext(os.path.basename(game_path))[0]
-    # 计算MD5（可选校验）
-    game_md5 = get_file_md5(game_path)
-    # 打开编辑窗口（传入MD5）
-    EditGameWindow(default_name, game_path, game_md5, get_games_data_file())
+    # 更新列表
+    if getattr(Select, "instance", None):
+        Select.instance.load_games()
+    tk.messagebox.showinfo("成功", f"已导入{len(imported)}个游戏！")
 
 
-def start_game(game_path: str, game_md5: Optional[str] = None) -> int:
+def start_game(
+    game_path: str,
+    game_hash: Optional[str] = None,
+    hash_algorithm: str = HASH_ALGORITHM,
+    file_stat: Optional[Tuple[int, int]] = None
+) -> int:
     """
-    启动游戏（修复中文路径、添加MD5校验、跟踪子进程）
+    启动游戏（修复中文路径、添加文件校验、跟踪子进程）
+    :param file_stat: 导入时记录的(大小, 修改时间ns)，与当前文件一致时跳过校验值计算
     :return: 1=成功, -1=启动失败, -2=文件不存在, -3=文件完整性校验失败
     """
     # 处理中文路径
@@ -91,28 +619,33 @@ def start_game(game_path: str, game_md5: Optional[str] = None) -> int:
         tk.messagebox.showerror("错误", f"游戏文件不存在：{game_path}")
         return -2
 
-    # 2. MD5完整性校验（若有）
-    if game_md5:
-        current_md5 = get_file_md5(game_path)
-        if current_md5 != game_md5:
-            tk.messagebox.showerror("错误", "游戏文件已被修改或损坏（MD5校验失败），请重新导入！")
+    # 2. 文件完整性校验（若有）：大小和修改时间均未变化时无需重新计算
+    if game_hash and (file_stat is None or get_file_stat(game_path) != file_stat):
+        current_hash = get_file_hash(game_path, hash_algorithm)
+        if current_hash != game_hash:
+            tk.messagebox.showerror("错误", "游戏文件已被修改或损坏（文件校验失败），请重新导入！")
             return -3
 
     # 3. 启动游戏（区分文件类型）
     try:
         if file_extension == ".html":
+            import webbrowser
             webbrowser.open_new_tab(f"file:///{game_path}")  # 修复HTML中文路径
             return 1
         else:
+            import subprocess
             # 处理exe中文路径和工作目录
             game_dir = os.path.dirname(game_path)
-            # 启动并跟踪子进程
-            proc = subprocess.Popen(
-                [game_path],
-                cwd=game_dir,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP  # 便于后续关闭
-            )
+            # 启动并跟踪子进程（放入独立进程组，便于后续连同其子进程一起关闭）
+            if os.name == "nt":
+                group_options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_options = {"start_new_session": True}
+            proc = subprocess.Popen([game_path], cwd=game_dir, **group_options)
+            reap_game_processes()
             GAME_PROCESSES.append(proc)
+            if os.name != "nt":
+                GAME_PROCESS_GROUPS.append(proc.pid)
             return 1
     except PermissionError:
         tk.messagebox.showerror("错误", f"权限不足：无法执行 {game_path}\n请以管理员身份运行启动器！")
@@ -125,40 +658,107 @@ def start_game(game_path: str, game_md5: Optional[str] = None) -> int:
         return -1
 
 
+def reap_game_processes():
+    """移除已退出的游戏子进程和已无进程的进程组，避免列表在长时间运行中无限增长"""
+    GAME_PROCESSES[:] = [proc for proc in GAME_PROCESSES if proc.poll() is None]
+    GAME_PROCESS_GROUPS[:] = [pgid for pgid in GAME_PROCESS_GROUPS if _process_group_alive(pgid)]
+
+
+def _process_group_alive(pgid: int) -> bool:
+    """进程组中是否还有进程（发送信号0只检查，不影响进程）"""
+    try:
+        os.killpg(pgid, 0)
+    except PermissionError:
+        return True  # 进程存在但无权发送信号
+    except OSError:
+        return False
+    return True
+
+
+def terminate_game_processes(timeout: float = 3):
+    """
+    结束所有仍在运行的游戏（连同游戏启动的子进程）：先全部发送结束信号，再共用同一个期限等待
+    非Windows系统向每个进程组发送SIGTERM，游戏进程本身已退出时也能结束组内剩余的进程
+    """
+    if os.name == "nt":
+        for proc in GAME_PROCESSES:
+            try:
+                terminate_game_process(proc)
+            except Exception:
+                pass  # 忽略关闭失败的进程
+    else:
+        import signal
+        for pgid in GAME_PROCESS_GROUPS:
+            try:
+                os.killpg(pgid, signal.SIGTERM)
+            except OSError:
+                pass
+    deadline = time.monotonic() + timeout
+    for proc in GAME_PROCESSES:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except Exception:
+            pass
+    # 组内其他进程不是本进程的子进程，无法wait，只能轮询到期限为止
+    while GAME_PROCESS_GROUPS and time.monotonic() < deadline:
+        reap_game_processes()
+        if GAME_PROCESS_GROUPS:
+            time.sleep(0.05)
+
+
+def terminate_game_process(proc: "subprocess.Popen"):
+    """
+    Windows：用taskkill /T结束游戏进程及其启动的整个进程树（CTRL_BREAK信号只对控制台程序有效）
+    """
+    import subprocess
+    try:
+        returncode = subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW,  # 不弹出控制台窗口
+            timeout=5
+        ).returncode
+    except (OSError, subprocess.TimeoutExpired):
+        returncode = -1
+    if returncode != 0:
+        proc.terminate()  # taskkill不可用或执行失败时至少结束游戏进程本身
+
+
 def get_last_selected_game() -> Optional[dict]:
     """
     获取上次选中游戏（修复JSON字段缺失）
-    返回：包含path、md5的字典，无则返回None
+    返回：包含path、hash、hash_algorithm、file_stat的字典，无则返回None
     """
     games_data_file = get_games_data_file()
     if not os.path.exists(games_data_file):
         return None
 
-    # 加锁读取，防止并发冲突
-    with FileLock(LOCK_FILE_PATH, timeout=5):
-        try:
-            with open(games_data_file, 'r', encoding='utf-8') as f:
-                games = json.load(f)
-            # 处理字段缺失：用get方法设默认值
-            for game in games:
-                if game.get("is_last_selected", False):
-                    return {
-                        "path": game.get("path", ""),
-                        "md5": game.get("md5", None)
-                    }
-        except json.JSONDecodeError:
-            tk.messagebox.showerror("错误", "游戏配置文件损坏，请删除games.json后重新导入！")
-        except Exception as e:
-            tk.messagebox.showerror("错误", f"读取游戏配置失败：{str(e)}")
+    try:
+        game = load_games_index(games_data_file)["last_selected"]
+        # 处理字段缺失：用get方法设默认值
+        if game is not None:
+            game_hash, hash_algorithm = get_game_hash(game)
+            return {
+                "path": game.get("path", ""),
+                "hash": game_hash,
+                "hash_algorithm": hash_algorithm,
+                "file_stat": get_game_file_stat(game)
+            }
+    except json.JSONDecodeError:
+        tk.messagebox.showerror("错误", "游戏配置文件损坏，请删除games.json后重新导入！")
+    except Exception as e:
+        tk.messagebox.showerror("错误", f"读取游戏配置失败：{str(e)}")
     return None
 
 
 class EditGameWindow(customtkinter.CTkToplevel):
-    def __init__(self, default_name: str, game_path: str, game_md5: Optional[str], games_data_file: str):
+    def __init__(self, default_name: str, game_path: str, games_data_file: str):
         super().__init__()
         self.default_name = default_name
         self.game_path = game_path
-        self.game_md5 = game_md5
+        self.game_hash: Optional[str] = None  # 后台计算完成后填充
+        self.file_stat: Optional[Tuple[int, int]] = None  # 计算校验值时的文件状态
         self.games_data_file = games_data_file
 
         # 窗口基础设置
@@ -177,30 +777,29 @@ class EditGameWindow(customtkinter.CTkToplevel):
         self.label = customtkinter.CTkLabel(
             self.main_frame,
             text="请为游戏输入名称:",
-            font=("Microsoft YaHei UI", 12)
+            font=get_font(12)
         )
         self.label.pack(pady=(10, 10))
 
         self.input_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
         self.input_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
 
-        self.name_label = customtkinter.CTkLabel(self.input_frame, text="名称:", font=("Microsoft YaHei UI", 12))
+        self.name_label = customtkinter.CTkLabel(self.input_frame, text="名称:", font=get_font(12))
         self.name_label.pack(side=tk.LEFT, padx=(0, 10))
 
-        self.name_entry = customtkinter.CTkEntry(self.input_frame, font=("Microsoft YaHei UI", 12), width=200)
+        self.name_entry = customtkinter.CTkEntry(self.input_frame, font=get_font(12), width=200)
         self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.name_entry.insert(0, default_name)
         self.name_entry.focus_set()
 
-        # MD5提示（可选显示）
-        if self.game_md5:
-            self.md5_label = customtkinter.CTkLabel(
-                self.main_frame,
-                text=f"文件MD5: {self.game_md5[:8]}...",  # 显示前8位，避免过长
-                font=("Microsoft YaHei UI", 10),
-                text_color="#888888"
-            )
-            self.md5_label.pack(pady=(0, 10))
+        # 校验值提示（后台计算，完成前显示占位文字）
+        self.hash_label = customtkinter.CTkLabel(
+            self.main_frame,
+            text="文件校验值: 计算中…",
+            font=get_font(10),
+            text_color="#888888"
+        )
+        self.hash_label.pack(pady=(0, 10))
 
         # 按钮区
         self.button_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
@@ -210,7 +809,8 @@ class EditGameWindow(customtkinter.CTkToplevel):
             self.button_frame,
             text="确定",
             command=self.import_with_new_name,
-            font=("Microsoft YaHei UI", 12)
+            font=get_font(12),
+            state="disabled"  # 校验值计算完成后启用
         )
         self.import_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
 
@@ -218,61 +818,72 @@ class EditGameWindow(customtkinter.CTkToplevel):
             self.button_frame,
             text="取消",
             command=self.destroy,
-            font=("Microsoft YaHei UI", 12)
+            font=get_font(12)
         )
         self.cancel_button.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(5, 0))
 
+        self._start_hash()
+
+    def _start_hash(self):
+        """在后台计算校验值，完成前禁用确定按钮"""
+        self.import_button.configure(state="disabled")
+        self.hash_label.configure(text="文件校验值: 计算中…")
+        run_when_done(self, get_file_hash_with_stat_async(self.game_path), self._on_hash)
+
+    def _on_hash(self, result: Tuple[Optional[str], Optional[Tuple[int, int]]]):
+        """校验值计算完成回调"""
+        file_hash, self.file_stat = result
+        self.game_hash = file_hash
+        # 显示前8位，避免过长
+        self.hash_label.configure(text=f"文件校验值: {file_hash[:8]}..." if file_hash else "文件校验值: 计算失败")
+        self.import_button.configure(state="normal")
+
     def import_with_new_name(self):
         new_name = self.name_entry.get().strip()
         if not new_name:
             tk.messagebox.showerror("错误", "游戏名称不能为空！")
             return
+        # 打开窗口后文件又有变化（或计算期间被修改）：重新计算，避免记录新文件状态配旧校验值
+        if self.game_hash and (self.file_stat is None or get_file_stat(self.game_path) != self.file_stat):
+            self._start_hash()
+            return
 
-        # 加锁读写，防止并发冲突
-        with FileLock(LOCK_FILE_PATH, timeout=5):
-            # 读取现有游戏（处理配置文件不存在/损坏）
-            games = []
-            if os.path.exists(self.games_data_file):
-                try:
-                    with open(self.games_data_file, 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                except json.JSONDecodeError:
-                    if tk.messagebox.askyesno("警告", "配置文件损坏，是否清空重新创建？"):
-                        games = []
-                    else:
-                        self.destroy()
-                        return
-                except Exception as e:
-                    tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
-                    self.destroy()
-                    return
-
+        def add_game(games: List[dict]) -> bool:
             # 检查名称唯一性（基于ID，允许名称重复但提示）
             name_exists = any(game.get("name") == new_name for game in games)
             if name_exists:
                 if not tk.messagebox.askyesno("提示", f"名称「{new_name}」已存在，是否继续？"):
-                    return
+                    return False
 
             # 添加新游戏（带唯一ID，解决名称重复问题）
             new_game = {
                 "id": str(uuid.uuid4()),  # 唯一ID，用于后续操作
                 "name": new_name,
                 "path": self.game_path,
-                "md5": self.game_md5,
+                "hash": self.game_hash,
                 "is_last_selected": False
             }
+            record_file_stat(new_game, self.file_stat)
             games.append(new_game)
+            return True
 
-            # 写入配置
+        # 加锁读写，防止并发冲突（处理配置文件不存在/损坏）
+        try:
             try:
-                with open(self.games_data_file, 'w', encoding='utf-8') as f:
-                    json.dump(games, f, ensure_ascii=False, indent=4)
-            except PermissionError:
-                tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行启动器！")
-                return
-            except Exception as e:
-                tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
-                return
+                saved = update_games_file(self.games_data_file, add_game)
+            except json.JSONDecodeError:
+                if not tk.messagebox.askyesno("警告", "配置文件损坏，是否清空重新创建？"):
+                    self.destroy()
+                    return
+                saved = update_games_file(self.games_data_file, add_game, reset_if_corrupted=True)
+        except PermissionError:
+            tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行启动器！")
+            return
+        except Exception as e:
+            tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+            return
+        if saved is None:
+            return
 
         # 更新列表
         if hasattr(Select, 'instance') and Select.instance:
@@ -308,11 +919,11 @@ class GameSettingsWindow(customtkinter.CTkToplevel):
         # 名称设置
         self.name_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
         self.name_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
-        self.name_label = customtkinter.CTkLabel(self.name_frame, text="游戏名称:", font=("Microsoft YaHei UI", 12))
+        self.name_label = customtkinter.CTkLabel(self.name_frame, text="游戏名称:", font=get_font(12))
         self.name_label.pack(side=tk.LEFT, padx=(0, 10))
         self.name_entry = customtkinter.CTkEntry(
             self.name_frame,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=250
         )
         self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -321,41 +932,44 @@ class GameSettingsWindow(customtkinter.CTkToplevel):
         # 路径设置
         self.path_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
         self.path_frame.pack(fill=tk.X, padx=20, pady=(5, 5))
-        self.path_label = customtkinter.CTkLabel(self.path_frame, text="游戏路径:", font=("Microsoft YaHei UI", 12))
+        self.path_label = customtkinter.CTkLabel(self.path_frame, text="游戏路径:", font=get_font(12))
         self.path_label.pack(side=tk.LEFT, padx=(0, 10))
         self.path_entry = customtkinter.CTkEntry(
             self.path_frame,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=250
         )
         self.path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.path_entry.insert(0, self.original_data.get("path", ""))
+        self.path_entry.bind("<KeyRelease>", lambda event: self.update_hash_display())  # 手动输入路径时更新校验值
         self.browse_button = customtkinter.CTkButton(
             self.path_frame,
             text="浏览...",
             command=self.browse_path,
-            font=("Microsoft YaHei UI", 10),
+            font=get_font(10),
             width=80
         )
         self.browse_button.pack(side=tk.RIGHT, padx=(10, 0))
 
-        # MD5校验设置
-        self.md5_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
-        self.md5_frame.pack(fill=tk.X, padx=20, pady=(5, 10))
-        self.md5_label = customtkinter.CTkLabel(
-            self.md5_frame,
-            text="文件MD5（自动生成）:",
-            font=("Microsoft YaHei UI", 12)
+        # 文件校验设置
+        self.hash_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
+        self.hash_frame.pack(fill=tk.X, padx=20, pady=(5, 10))
+        self.hash_label = customtkinter.CTkLabel(
+            self.hash_frame,
+            text="文件校验值（自动生成）:",
+            font=get_font(12)
         )
-        self.md5_label.pack(side=tk.LEFT, padx=(0, 10))
-        self.md5_entry = customtkinter.CTkEntry(
-            self.md5_frame,
-            font=("Microsoft YaHei UI", 10),
+        self.hash_label.pack(side=tk.LEFT, padx=(0, 10))
+        self.hash_entry = customtkinter.CTkEntry(
+            self.hash_frame,
+            font=get_font(10),
             text_color="#888888",
             state="readonly"
         )
-        self.md5_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.update_md5_display()  # 初始显示MD5
+        self.hash_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._hash_future: Optional[Future] = None  # 最近一次提交的校验值计算任务
+        self._hash_path: Optional[str] = None  # 该任务对应的路径
+        self._hash_after_id: Optional[str] = None  # 等待执行的校验值更新（防抖）
 
         # 按钮区
         self.button_frame = customtkinter.CTkFrame(self.main_frame, fg_color="transparent")
@@ -364,17 +978,19 @@ class GameSettingsWindow(customtkinter.CTkToplevel):
             self.button_frame,
             text="保存",
             command=self.save_settings,
-            font=("Microsoft YaHei UI", 12)
+            font=get_font(12)
         )
         self.save_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         self.cancel_button = customtkinter.CTkButton(
             self.button_frame,
             text="取消",
             command=self.destroy,
-            font=("Microsoft YaHei UI", 12)
+            font=get_font(12)
         )
         self.cancel_button.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(5, 0))
 
+        self._do_update_hash_display()  # 初始显示校验值
+
     def _get_main_window(self, parent) -> Optional[tk.Tk]:
         """获取主窗口引用（修复层级问题）"""
         if isinstance(parent, AdaptiveApp):
@@ -397,28 +1013,57 @@ class GameSettingsWindow(customtkinter.CTkToplevel):
         if filename:
             self.path_entry.delete(0, tk.END)
             self.path_entry.insert(0, os.path.abspath(filename))
-            self.update_md5_display()  # 路径变化时更新MD5
-
-    def update_md5_display(self):
-        """更新MD5显示"""
+            self.update_hash_display()  # 路径变化时更新校验值
+
+    def update_hash_display(self):
+        """更新校验值显示（防抖：连续输入时只在停止输入300ms后计算一次）"""
+        # 旧路径的结果立即作废，等待期间禁用保存，避免显示或保存与当前路径不符的校验值
+        self._hash_future = None
+        self._set_hash_text("计算中…")
+        self.save_button.configure(state="disabled")
+        if self._hash_after_id:
+            self.after_cancel(self._hash_after_id)
+        self._hash_after_id = self.after(300, self._do_update_hash_display)
+
+    def _do_update_hash_display(self):
+        """立即更新校验值显示（后台计算，计算期间禁用保存）"""
+        self._hash_after_id = None
         game_path = self.path_entry.get().strip()
         if not game_path or not os.path.exists(game_path):
-            self.md5_entry.configure(state="normal")
-            self.md5_entry.delete(0, tk.END)
-            self.md5_entry.insert(0, "文件不存在或路径为空")
-            self.md5_entry.configure(state="readonly")
+            self._hash_future = None
+            self._set_hash_text("文件不存在或路径为空")
+            self.save_button.configure(state="normal")
             return
-        
-        md5 = get_file_md5(game_path)
-        self.md5_entry.configure(state="normal")
-        self.md5_entry.delete(0, tk.END)
-        self.md5_entry.insert(0, md5[:16] + "..." if md5 else "计算失败")  # 显示前16位
-        self.md5_entry.configure(state="readonly")
+
+        self._set_hash_text("计算中…")
+        self.save_button.configure(state="disabled")
+        future = self._hash_future = get_file_hash_with_stat_async(game_path)
+        self._hash_path = game_path
+        run_when_done(self, future, lambda result: self._on_hash(future, result[0]))
+
+    def _on_hash(self, future: Future, file_hash: Optional[str]):
+        """校验值计算完成回调（忽略已被新路径取代的结果）"""
+        if future is not self._hash_future:
+            return
+        self._set_hash_text(file_hash[:16] + "..." if file_hash else "计算失败")  # 显示前16位
+        self.save_button.configure(state="normal")
+
+    def destroy(self):
+        # 取消尚未执行的防抖任务，避免窗口销毁后回调失效报错
+        if self._hash_after_id:
+            self.after_cancel(self._hash_after_id)
+            self._hash_after_id = None
+        super().destroy()
+
+    def _set_hash_text(self, text: str):
+        self.hash_entry.configure(state="normal")
+        self.hash_entry.delete(0, tk.END)
+        self.hash_entry.insert(0, text)
+        self.hash_entry.configure(state="readonly")
 
     def save_settings(self):
         new_name = self.name_entry.get().strip()
         new_path = self.path_entry.get().strip()
-        new_md5 = get_file_md5(new_path) if new_path else None
 
         # 基础校验
         if not new_name:
@@ -430,54 +1075,59 @@ class GameSettingsWindow(customtkinter.CTkToplevel):
         if not os.path.exists(new_path):
             tk.messagebox.showerror("错误", f"文件不存在：{new_path}")
             return
+        # 使用后台已算好的校验值（计算完成前保存按钮处于禁用状态），不在界面线程中计算
+        future = self._hash_future
+        if future is None or not future.done() or self._hash_path != new_path:
+            self._do_update_hash_display()
+            return
+        new_hash, file_stat = future.result()
+        # 计算后文件又有变化（或计算期间被修改）：重新计算，避免记录新文件状态配旧校验值
+        if new_hash and (file_stat is None or get_file_stat(new_path) != file_stat):
+            self._do_update_hash_display()
+            return
 
-        # 加锁修改
-        with FileLock(LOCK_FILE_PATH, timeout=5):
-            games = []
-            if os.path.exists(self.games_data_file):
-                try:
-                    with open(self.games_data_file, 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                except json.JSONDecodeError:
-                    tk.messagebox.showerror("错误", "配置文件损坏，无法修改！")
-                    return
-                except Exception as e:
-                    tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
-                    return
+        def update_game(games: List[dict]) -> bool:
+            # 一次遍历建立索引：ID -> 游戏（重复ID以首条为准）、其他游戏的名称集合
+            games_by_id: Dict[str, dict] = {}
+            other_names = set()
+            for game in games:
+                game_id = get_game_id(game)
+                games_by_id.setdefault(game_id, game)
+                if game_id != self.game_id:
+                    other_names.add(game.get("name"))
 
             # 找到对应游戏（基于ID）
-            game_updated = False
-            for i, game in enumerate(games):
-                if game.get("id") == self.game_id:
-                    # 检查名称重复（提示但允许）
-                    name_exists = any(
-                        g.get("name") == new_name and g.get("id") != self.game_id 
-                        for g in games
-                    )
-                    if name_exists and not tk.messagebox.askyesno("提示", f"名称「{new_name}」已存在，是否继续？"):
-                        return
-                    
-                    # 更新游戏数据
-                    games[i]["name"] = new_name
-                    games[i]["path"] = new_path
-                    games[i]["md5"] = new_md5
-                    game_updated = True
-                    break
-
-            if not game_updated:
+            target_game = games_by_id.get(self.game_id)
+            if target_game is None:
                 tk.messagebox.showerror("错误", "未找到要修改的游戏！")
-                return
+                return False
 
-            # 保存配置
-            try:
-                with open(self.games_data_file, 'w', encoding='utf-8') as f:
-                    json.dump(games, f, ensure_ascii=False, indent=4)
-            except PermissionError:
-                tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
-                return
-            except Exception as e:
-                tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+            # 检查名称重复（提示但允许）
+            if new_name in other_names and not tk.messagebox.askyesno("提示", f"名称「{new_name}」已存在，是否继续？"):
+                return False
+
+            # 更新游戏数据（旧记录没有ID时写入，之后修改路径也不影响ID）
+            target_game["id"] = self.game_id
+            target_game["name"] = new_name
+            target_game["path"] = new_path
+            target_game["hash"] = new_hash
+            target_game.pop("md5", None)  # 重新计算后不再需要旧版字段
+            record_file_stat(target_game, file_stat)
+            return True
+
+        # 加锁修改
+        try:
+            if update_games_file(self.games_data_file, update_game) is None:
                 return
+        except json.JSONDecodeError:
+            tk.messagebox.showerror("错误", "配置文件损坏，无法修改！")
+            return
+        except PermissionError:
+            tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
+            return
+        except Exception as e:
+            tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+            return
 
         # 更新UI
         if hasattr(Select, 'instance') and Select.instance:
@@ -500,6 +1150,8 @@ class Select(customtkinter.CTkToplevel):
         self.parent = parent
         self.games_data_file = get_games_data_file()
         self.current_games: List[dict] = []  # 存储当前游戏数据（含ID）
+        self._displayed_names: List[str] = []  # 列表框中当前显示的名称，用于差异更新
+        self._loaded_games: Optional[List[dict]] = None  # 上次加载时的配置（缓存对象），未变化则无需刷新
 
         # 窗口设置
         self.title("选择游戏")
@@ -515,7 +1167,7 @@ class Select(customtkinter.CTkToplevel):
         self.import_button = customtkinter.CTkButton(
             self.top_button_frame,
             text="导入游戏",
-            font=("Microsoft YaHei UI", 14),
+            font=get_font(14),
             command=import_game,
             height=40
         )
@@ -523,7 +1175,7 @@ class Select(customtkinter.CTkToplevel):
         self.refresh_button = customtkinter.CTkButton(
             self.top_button_frame,
             text="刷新列表",
-            font=("Microsoft YaHei UI", 14),
+            font=get_font(14),
             height=40,
             command=self.load_games
         )
@@ -538,7 +1190,7 @@ class Select(customtkinter.CTkToplevel):
             fg="white",
             selectbackground="#1f538d",
             selectforeground="white",
-            font=("Microsoft YaHei UI", 16),
+            font=(FONT_FAMILY, 16),  # 普通Tk控件使用磅值字号（CTkFont以像素为单位，且不随DPI缩放）
             relief=tk.FLAT,
             bd=0,
             activestyle="none"
@@ -553,7 +1205,7 @@ class Select(customtkinter.CTkToplevel):
             self.bottom_button_frame,
             text="游戏设置",
             command=self.open_game_settings,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=100,
             height=35
         )
@@ -562,7 +1214,7 @@ class Select(customtkinter.CTkToplevel):
             self.bottom_button_frame,
             text="删除游戏",
             command=self.delete_game,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=100,
             height=35
         )
@@ -571,7 +1223,7 @@ class Select(customtkinter.CTkToplevel):
             self.bottom_button_frame,
             text="选择并关闭",
             command=self.save_and_close,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=150,
             height=35
         )
@@ -581,38 +1233,65 @@ class Select(customtkinter.CTkToplevel):
         self.load_games()
 
     def load_games(self):
-        """加载游戏列表（修复JSON字段缺失、重复错误提示）"""
-        self.game_listbox.delete(0, tk.END)
-        self.current_games.clear()
-
-        if not os.path.exists(self.games_data_file):
-            self.current_games = []
-            return
-
-        # 加锁读取
-        with FileLock(LOCK_FILE_PATH, timeout=5):
+        """加载游戏列表（修复JSON字段缺失、重复错误提示；配置未变化时不刷新）"""
+        current_games: List[dict] = []
+        games = None
+        if os.path.exists(self.games_data_file):
             try:
-                with open(self.games_data_file, 'r', encoding='utf-8') as f:
-                    games = json.load(f)
+                games = load_games_cached(self.games_data_file)
+                # 配置文件未变化（仍是同一份缓存）：列表无需任何改动
+                if games is self._loaded_games:
+                    return
+                # 旧版配置：后台将md5字段迁移为新的校验值，写回后刷新列表
+                if any("md5" in game and "hash" not in game for game in games):
+                    migrate_legacy_hashes(self.parent, self.games_data_file, games, self._on_hashes_migrated)
                 # 处理字段缺失：补全默认值
                 for game in games:
-                    self.current_games.append({
-                        "id": game.get("id", str(uuid.uuid4())),  # 无ID则自动生成
+                    current_games.append({
+                        "id": get_game_id(game),  # 无ID则由路径生成固定ID
                         "name": game.get("name", "未知游戏"),
                         "path": game.get("path", ""),
-                        "md5": game.get("md5", None),
+                        "hash": get_game_hash(game)[0],
                         "is_last_selected": game.get("is_last_selected", False)
                     })
                 # 排序：上次选中的排在前面
-                self.current_games.sort(key=lambda x: not x["is_last_selected"])
-                # 填充列表
-                for game in self.current_games:
-                    self.game_listbox.insert(tk.END, game["name"])
+                current_games.sort(key=lambda x: not x["is_last_selected"])
             except json.JSONDecodeError:
+                games, current_games = None, []
                 tk.messagebox.showerror("错误", "配置文件损坏，请删除games.json后重新导入！")
             except Exception as e:
+                games, current_games = None, []
                 tk.messagebox.showerror("错误", f"加载游戏列表失败：{str(e)}")
 
+        self._loaded_games = games
+        self.current_games = current_games
+        self._update_listbox([game["name"] for game in current_games])
+
+    def _on_hashes_migrated(self):
+        """旧版记录迁移完成：选择窗口仍打开时刷新列表"""
+        if getattr(Select, "instance", None):
+            Select.instance.load_games()
+
+    def _update_listbox(self, names: List[str]):
+        """差异更新列表框：跳过首尾相同的行，中间变化的部分一次删除、一次批量插入
+
+        Listbox本身只绘制可见行，开销主要在逐行调用Tcl上，因此整段替换而不是逐行操作
+        """
+        old_names = self._displayed_names
+        common = min(len(old_names), len(names))
+        start = 0
+        while start < common and old_names[start] == names[start]:
+            start += 1
+        old_end, new_end = len(old_names), len(names)
+        while old_end > start and new_end > start and old_names[old_end - 1] == names[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        if old_end > start:
+            self.game_listbox.delete(start, old_end - 1)
+        if new_end > start:
+            self.game_listbox.insert(start, *names[start:new_end])
+        self._displayed_names = names
+
     def on_double_click(self, event):
         """双击选择游戏"""
         self.save_and_close()
@@ -632,31 +1311,24 @@ class Select(customtkinter.CTkToplevel):
         selected_game = self.current_games[selected_idx]
         selected_game_id = selected_game["id"]
 
-        # 加锁更新选中状态
-        with FileLock(LOCK_FILE_PATH, timeout=5):
-            games = []
-            if os.path.exists(self.games_data_file):
-                try:
-                    with open(self.games_data_file, 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                except Exception as e:
-                    tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
-                    return
-
+        def select_game(games: List[dict]) -> bool:
             # 更新选中状态（基于ID）
             for game in games:
-                game["is_last_selected"] = (game.get("id") == selected_game_id)
+                game["is_last_selected"] = (get_game_id(game) == selected_game_id)
+            return True
 
-            # 保存配置
-            try:
-                with open(self.games_data_file, 'w', encoding='utf-8') as f:
-                    json.dump(games, f, ensure_ascii=False, indent=4)
-            except PermissionError:
-                tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
-                return
-            except Exception as e:
-                tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
-                return
+        # 加锁更新选中状态
+        try:
+            update_games_file(self.games_data_file, select_game)
+        except json.JSONDecodeError as e:
+            tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
+            return
+        except PermissionError:
+            tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
+            return
+        except Exception as e:
+            tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+            return
 
         # 更新主窗口标签
         self.parent.update_selected_game_label(selected_game["name"])
@@ -698,34 +1370,28 @@ class Select(customtkinter.CTkToplevel):
         if not tk.messagebox.askyesno("确认删除", f"确定要删除游戏「{selected_game['name']}」吗？"):
             return
 
-        # 加锁删除
-        with FileLock(LOCK_FILE_PATH, timeout=5):
-            games = []
-            if os.path.exists(self.games_data_file):
-                try:
-                    with open(self.games_data_file, 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                except Exception as e:
-                    tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
-                    return
-
+        def remove_game(games: List[dict]) -> bool:
             # 基于ID删除（仅删除选中的游戏）
             original_count = len(games)
-            games = [game for game in games if game.get("id") != selected_game["id"]]
+            games[:] = [game for game in games if get_game_id(game) != selected_game["id"]]
             if len(games) == original_count:
                 tk.messagebox.showerror("错误", "未找到要删除的游戏！")
-                return
+                return False
+            return True
 
-            # 保存配置
-            try:
-                with open(self.games_data_file, 'w', encoding='utf-8') as f:
-                    json.dump(games, f, ensure_ascii=False, indent=4)
-            except PermissionError:
-                tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
-                return
-            except Exception as e:
-                tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+        # 加锁删除
+        try:
+            if update_games_file(self.games_data_file, remove_game) is None:
                 return
+        except json.JSONDecodeError as e:
+            tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
+            return
+        except PermissionError:
+            tk.messagebox.showerror("错误", "无写入权限，请以管理员身份运行！")
+            return
+        except Exception as e:
+            tk.messagebox.showerror("错误", f"保存配置失败：{str(e)}")
+            return
 
         # 更新UI
         self.load_games()
@@ -772,7 +1438,7 @@ class AdaptiveApp(customtkinter.CTk):
         self.selected_game_label = customtkinter.CTkLabel(
             self.bottom_right_frame,
             text="未选择游戏",
-            font=("Microsoft YaHei UI", 15),
+            font=get_font(15),
             fg_color="transparent"
         )
         self.selected_game_label.pack(side=tk.TOP, anchor=tk.E, padx=5, pady=(0, 5))
@@ -787,7 +1453,7 @@ class AdaptiveApp(customtkinter.CTk):
             self.button_frame,
             text="选择游戏",
             command=self.open_select_window,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=100,
             height=40
         )
@@ -797,7 +1463,7 @@ class AdaptiveApp(customtkinter.CTk):
             self.button_frame,
             text="游戏设置",
             command=self.open_game_settings,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=100,
             height=40
         )
@@ -807,7 +1473,7 @@ class AdaptiveApp(customtkinter.CTk):
             self.button_frame,
             text="启动游戏",
             command=self.start_selected_game,
-            font=("Microsoft YaHei UI", 12),
+            font=get_font(12),
             width=210,
             height=40
         )
@@ -817,60 +1483,93 @@ class AdaptiveApp(customtkinter.CTk):
         self.load_last_selected_game()
         # 绑定关闭事件（清理子进程）
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        # 窗口尺寸变化时重新调整Logo大小（防抖，拖动过程中不反复缩放）
+        self._resize_job: Optional[str] = None
+        self.bind("<Configure>", self._schedule_resize, add="+")  # 保留customtkinter自身的绑定
+        # 定期清理已退出的游戏进程，关闭时只需处理仍在运行的进程
+        self._reap_job = self.after(2000, self._reap_game_processes)
 
     def load_logo(self):
         """加载Logo（修复中文路径和图片不存在问题）"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        image_path = os.path.join(script_dir, "logo.png")
-        image_path = os.path.abspath(image_path)  # 处理中文路径
-
         try:
-            if os.path.exists(image_path):
-                self.image = Image.open(image_path)
+            logo_bytes = get_logo_bytes()
+            if logo_bytes is not None:
+                # 复制出完整解码的原图（图片损坏时在此处报错）
+                with Image.open(io.BytesIO(logo_bytes)) as image:
+                    self.image = image.copy()
             else:
                 # 图片不存在时显示默认红色背景
                 self.image = Image.new("RGB", (400, 200), color="#333333")
                 # 添加文字提示
-                from PIL import ImageDraw, ImageFont
                 draw = ImageDraw.Draw(self.image)
-                font = ImageFont.truetype("simhei.ttf", 20) if os.path.exists("simhei.ttf") else None
+                font = get_logo_font(20)
                 if font:
                     draw.text((50, 80), "Logo图片缺失", fill="white", font=font)
-                    draw.text((50, 110), f"路径：{image_path}", fill="#888888", font=ImageFont.truetype("simhei.ttf", 12))
+                    draw.text((50, 110), f"路径：{LOGO_PATH}", fill="#888888", font=get_logo_font(12))
         except Exception as e:
             # 图片损坏时显示错误
             self.image = Image.new("RGB", (400, 200), color="#442222")
-            from PIL import ImageDraw, ImageFont
             draw = ImageDraw.Draw(self.image)
-            font = ImageFont.truetype("simhei.ttf", 20) if os.path.exists("simhei.ttf") else None
+            font = get_logo_font(20)
             if font:
                 draw.text((50, 80), "Logo加载失败", fill="white", font=font)
-                draw.text((50, 110), str(e), fill="#888888", font=ImageFont.truetype("simhei.ttf", 12))
+                draw.text((50, 110), str(e), fill="#888888", font=get_logo_font(12))
 
-        # 调整图片大小
-        self.update_image_size()
-        self.photo_image = ImageTk.PhotoImage(self.image)
+        # 保留原图，每次都从原图缩放，避免反复缩放损失画质
+        self._original_image = self.image
+        self.photo_image: Optional[ImageTk.PhotoImage] = None  # 唯一的显示图片
+        self._last_size: Optional[Tuple[int, int]] = None  # 当前显示图片的尺寸
         self.image_label = customtkinter.CTkLabel(
             self.main_frame,
-            image=self.photo_image,
             text="",
             fg_color="transparent"
         )
+        # 调整图片大小
+        self.update_image_size()
         self.image_label.pack(side=tk.TOP, anchor=tk.N, pady=10)
 
+    def _schedule_resize(self, event):
+        """窗口尺寸变化后延迟80ms调整Logo，期间的新变化会重新计时"""
+        if event.widget is not self:
+            return  # 子控件的Configure事件也会传到主窗口，忽略
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(80, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_job = None
+        self.update_image_size()
+
+    def _reap_game_processes(self):
+        reap_game_processes()
+        self._reap_job = self.after(2000, self._reap_game_processes)
+
     def update_image_size(self):
-        """调整Logo大小以适应窗口"""
+        """调整Logo大小以适应窗口（始终只保留一个PhotoImage，避免Tk图片对象累积）"""
         max_width = int(self.winfo_width() * 0.8)
         max_height = int(self.winfo_height() * 0.6)
-        original_width, original_height = self.image.size
+        original_width, original_height = self._original_image.size
 
         # 计算缩放比例
         scale = min(max_width / original_width, max_height / original_height, 1.0)
-        new_width = int(original_width * scale)
-        new_height = int(original_height * scale)
+        new_size = (int(original_width * scale), int(original_height * scale))
+        if min(new_size) < 1:
+            return  # 窗口尚未显示，等待显示后的Configure事件
+        if new_size == self._last_size:
+            return  # 尺寸未变化（大多数Configure事件），无需重新缩放
+
+        if new_size != self._original_image.size:
+            # 大幅缩小时先做快速的整数倍缩小，再对较小的中间图做插值
+            self.image = self._original_image.resize(new_size, LOGO_RESAMPLE, reducing_gap=3.0)
+        else:
+            self.image = self._original_image
 
-        if new_width != original_width or new_height != original_height:
-            self.image = self.image.resize((new_width, new_height), Image.LANCZOS)
+        # 先解除标签引用并释放旧图片，再创建新图片
+        self.image_label.configure(image="")
+        self.photo_image = None
+        self.photo_image = ImageTk.PhotoImage(self.image)
+        self.image_label.configure(image=self.photo_image)
+        self._last_size = new_size
 
     def open_select_window(self):
         """打开游戏选择窗口（单例，避免多窗口）"""
@@ -889,36 +1588,28 @@ class AdaptiveApp(customtkinter.CTk):
             return
 
         games_data_file = get_games_data_file()
-        if not os.path.exists(games_data_file):
-            tk.messagebox.showerror("错误", "配置文件不存在，无游戏可设置！")
-            return
-
-        # 查找当前游戏的ID和数据
-        with FileLock(LOCK_FILE_PATH, timeout=5):
-            try:
-                with open(games_data_file, 'r', encoding='utf-8') as f:
-                    games = json.load(f)
-                # 匹配名称（优先上次选中的）
-                target_game = None
-                for game in games:
-                    if game.get("name") == current_name:
-                        if game.get("is_last_selected", False):
-                            target_game = game
-                            break
-                        target_game = target_game or game
-                if not target_game:
-                    tk.messagebox.showerror("错误", f"未找到游戏「{current_name}」！")
-                    return
+        # 查找当前游戏的ID和数据（文件是否存在由读取时的stat判断，无需单独检查）
+        try:
+            games_index = load_games_index(games_data_file)
+            # 匹配名称（优先上次选中的；否则取第一个同名游戏，均已在索引中，无需遍历）
+            target_game = games_index["last_selected"]
+            if target_game is None or target_game.get("name") != current_name:
+                target_game = games_index["by_name"].get(current_name)
+            if not target_game:
+                tk.messagebox.showerror("错误", f"未找到游戏「{current_name}」！")
+                return
 
-                # 打开设置窗口
-                GameSettingsWindow(
-                    parent=self,
-                    game_id=target_game.get("id", str(uuid.uuid4())),
-                    game_data=target_game,
-                    games_data_file=games_data_file
-                )
-            except Exception as e:
-                tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
+            # 打开设置窗口
+            GameSettingsWindow(
+                parent=self,
+                game_id=get_game_id(target_game),
+                game_data=target_game,
+                games_data_file=games_data_file
+            )
+        except FileNotFoundError:
+            tk.messagebox.showerror("错误", "配置文件不存在，无游戏可设置！")
+        except Exception as e:
+            tk.messagebox.showerror("错误", f"读取配置失败：{str(e)}")
 
     def start_selected_game(self):
         """启动当前选中游戏"""
@@ -928,11 +1619,63 @@ class AdaptiveApp(customtkinter.CTk):
             return
 
         # 启动游戏并处理结果
-        result = start_game(last_game["path"], last_game["md5"])
+        result = start_game(
+            last_game["path"],
+            last_game["hash"],
+            last_game["hash_algorithm"],
+            last_game["file_stat"]
+        )
         if result == 1:
-            # 启动成功可选项：最小化主窗口
-            if tk.messagebox.askyesno("成功", "游戏已启动，是否最小化启动器？"):
-                self.iconify()
+            # 启动成功可选项：最小化主窗口（非阻塞提示，不影响主窗口响应）
+            def on_click(choice: str):
+                if choice == "是":
+                    self.iconify()
+            self._toast("游戏已启动，是否最小化启动器？", on_click=on_click)
+
+    def _toast(
+        self,
+        message: str,
+        buttons: Tuple[str, ...] = ("是", "否"),
+        on_click: Optional[Callable[[str], None]] = None,
+        timeout_ms: int = 5000
+    ):
+        """
+        非阻塞提示窗口：不调用grab_set/wait_window，主窗口照常响应；超时未选择则自动关闭
+        仅用于非关键的确认，错误提示仍使用messagebox
+        :param on_click: 点击按钮后以按钮文字调用
+        """
+        toast = customtkinter.CTkToplevel(self)
+        toast.title(APP_NAME)
+        toast.resizable(False, False)
+        toast.transient(self)
+
+        label = customtkinter.CTkLabel(toast, text=message, font=get_font(12))
+        label.pack(padx=20, pady=(15, 10))
+        button_frame = customtkinter.CTkFrame(toast, fg_color="transparent")
+        button_frame.pack(padx=20, pady=(0, 15))
+
+        def close():
+            if toast.winfo_exists():
+                toast.destroy()
+
+        # 定时器挂在主窗口上，提示窗口关闭后不会留下失效的回调
+        close_job = self.after(timeout_ms, close)
+
+        def click(choice: str):
+            self.after_cancel(close_job)
+            close()
+            if on_click:
+                on_click(choice)
+
+        for text in buttons:
+            button = customtkinter.CTkButton(
+                button_frame,
+                text=text,
+                command=lambda choice=text: click(choice),
+                font=get_font(12),
+                width=80
+            )
+            button.pack(side=tk.LEFT, padx=5)
 
     def update_selected_game_label(self, game_name: str):
         """更新选中游戏标签（移除冗余代码）"""
@@ -944,16 +1687,13 @@ class AdaptiveApp(customtkinter.CTk):
         if last_game:
             # 读取游戏名称（避免直接用路径推导）
             games_data_file = get_games_data_file()
-            with FileLock(LOCK_FILE_PATH, timeout=5):
-                try:
-                    with open(games_data_file, 'r', encoding='utf-8') as f:
-                        games = json.load(f)
-                    for game in games:
-                        if game.get("path") == last_game["path"] and game.get("is_last_selected", False):
-                            self.update_selected_game_label(game.get("name", "未知游戏"))
-                            return
-                except Exception:
-                    pass  # 忽略读取错误，显示路径推导名称
+            try:
+                game = load_games_index(games_data_file)["last_selected"]
+                if game is not None and game.get("path") == last_game["path"]:
+                    self.update_selected_game_label(game.get("name", "未知游戏"))
+                    return
+            except Exception:
+                pass  # 忽略读取错误，显示路径推导名称
             # 备选：从路径推导名称
             game_name = os.path.splitext(os.path.basename(last_game["path"]))[0]
             self.update_selected_game_label(game_name)
@@ -962,15 +1702,20 @@ class AdaptiveApp(customtkinter.CTk):
 
     def on_closing(self):
         """关闭主窗口（清理子进程和子窗口）"""
-        # 关闭所有游戏子进程
-        if GAME_PROCESSES:
+        # 关闭所有仍在运行的游戏子进程
+        reap_game_processes()
+        if GAME_PROCESSES or GAME_PROCESS_GROUPS:
             if tk.messagebox.askyesno("确认关闭", "是否关闭所有已启动的游戏？"):
-                for proc in GAME_PROCESSES:
-                    try:
-                        proc.terminate()
-                        proc.wait(timeout=3)
-                    except Exception:
-                        pass  # 忽略关闭失败的进程
+                terminate_game_processes()
+
+        # 取消排队中的校验值计算，再保存校验值缓存，下次启动时复用
+        shutdown_hash_pool()
+        save_hash_cache()
+
+        # 取消尚未执行的Logo调整和进程清理
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self.after_cancel(self._reap_job)
 
         # 关闭子窗口
         if self.select_window and self.select_window.winfo_exists():
@@ -981,12 +1726,12 @@ class AdaptiveApp(customtkinter.CTk):
 
 
 if __name__ == "__main__":
-    # 检查依赖库（提示用户安装缺失库）
-    try:
-        from filelock import FileLock
-    except ImportError:
+    # 检查依赖库（提示用户安装缺失库；filelock延迟导入，这里只检查是否已安装）
+    import importlib.util
+    if importlib.util.find_spec("filelock") is None:
         tk.messagebox.showerror("错误", "缺少依赖库，请先运行：pip install filelock pillow customtkinter")
         sys.exit(1)
 
+    load_hash_cache()
     app = AdaptiveApp()
     app.mainloop()
\ No newline at end of file